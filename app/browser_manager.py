@@ -8,6 +8,7 @@ by avoiding the 1-2s startup time for each request.
 import asyncio
 import logging
 import random
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
@@ -19,13 +20,13 @@ logger = logging.getLogger(__name__)
 
 
 # User agents for rotation on retries
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-]
+)
 
 
 class BrowserManager:
@@ -44,6 +45,9 @@ class BrowserManager:
         self._browser: Optional[Browser] = None
         self._initialized: bool = False
         self._settings = get_settings()
+        # Long-lived contexts keyed by user agent, oldest first
+        self._contexts: "OrderedDict[str, BrowserContext]" = OrderedDict()
+        self._contexts_lock = asyncio.Lock()
 
     @classmethod
     async def get_instance(cls) -> "BrowserManager":
@@ -82,6 +86,14 @@ class BrowserManager:
         """Close the browser and cleanup resources."""
         logger.info("Closing browser...")
 
+        contexts = list(self._contexts.values())
+        self._contexts.clear()
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing context: {e}")
+
         if self._browser:
             try:
                 await self._browser.close()
@@ -108,19 +120,107 @@ class BrowserManager:
         """Get a random user agent for anti-detection."""
         return random.choice(USER_AGENTS)
 
+    async def _new_context(self, user_agent: str) -> BrowserContext:
+        """Create a browser context with stealth scripts for the given user agent."""
+        context = await self._browser.new_context(
+            user_agent=user_agent,
+            viewport={"width": 1920, "height": 1080},
+            java_script_enabled=True,
+            ignore_https_errors=False,  # Enforce HTTPS validation for security
+            extra_http_headers={
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+                "Accept-Encoding": "gzip, deflate",
+                "DNT": "1",
+                "Connection": "keep-alive",
+                "Upgrade-Insecure-Requests": "1",
+            },
+        )
+
+        # Inject stealth scripts to evade bot detection
+        await context.add_init_script("""
+            // Remove webdriver property
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+
+            // Mock plugins
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5],
+            });
+
+            // Mock languages
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['en-US', 'en'],
+            });
+
+            // Override chrome property
+            window.chrome = {
+                runtime: {},
+            };
+
+            // Mock permissions
+            const originalQuery = window.navigator.permissions.query;
+            window.navigator.permissions.query = (parameters) => (
+                parameters.name === 'notifications' ?
+                    Promise.resolve({ state: Notification.permission }) :
+                    originalQuery(parameters)
+            );
+        """)
+        return context
+
+    async def _get_shared_context(self, user_agent: str) -> BrowserContext:
+        """
+        Get the long-lived context for a user agent, creating it on first use.
+
+        At most len(USER_AGENTS) contexts are kept; the oldest is closed
+        when a new user agent would exceed that.
+        """
+        async with self._contexts_lock:
+            context = self._contexts.get(user_agent)
+            if context is not None:
+                self._contexts.move_to_end(user_agent)
+                return context
+
+            context = await self._new_context(user_agent)
+            context.on("close", lambda _: self._forget_context(user_agent, context))
+            self._contexts[user_agent] = context
+
+            evicted = []
+            while len(self._contexts) > len(USER_AGENTS):
+                evicted.append(self._contexts.popitem(last=False)[1])
+
+        for stale in evicted:
+            try:
+                await stale.close()
+            except Exception as e:
+                logger.warning(f"Error closing context: {e}")
+
+        return context
+
+    def _forget_context(self, user_agent: str, context: BrowserContext) -> None:
+        """Drop a context from the pool once playwright reports it closed."""
+        if self._contexts.get(user_agent) is context:
+            del self._contexts[user_agent]
+
     @asynccontextmanager
     async def get_page(
         self,
         user_agent: Optional[str] = None,
+        reuse_context: bool = False,
     ) -> AsyncGenerator[Page, None]:
         """
-        Get a new browser page in an isolated context.
+        Get a new browser page.
 
-        The context and page are automatically closed after use to prevent
-        memory leaks. Each request gets a fresh context with no shared cookies.
+        By default the page gets an isolated context with no shared cookies,
+        and both are closed after use to prevent memory leaks. With
+        reuse_context the page opens in a long-lived context for its user
+        agent and only the page is closed, which skips the context setup
+        cost on every scrape.
 
         Args:
             user_agent: Optional user agent string. Random if not provided.
+            reuse_context: Open the page in the shared context for this user agent.
 
         Yields:
             A Playwright Page object.
@@ -131,63 +231,21 @@ class BrowserManager:
         if user_agent is None:
             user_agent = self.get_random_user_agent()
 
-        # Create isolated context for this request
         context: Optional[BrowserContext] = None
         page: Optional[Page] = None
 
         try:
-            context = await self._browser.new_context(
-                user_agent=user_agent,
-                viewport={"width": 1920, "height": 1080},
-                java_script_enabled=True,
-                ignore_https_errors=False,  # Enforce HTTPS validation for security
-                extra_http_headers={
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate",
-                    "DNT": "1",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                },
-            )
-
-            # Inject stealth scripts to evade bot detection
-            await context.add_init_script("""
-                // Remove webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-
-                // Mock plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-
-                // Mock languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-
-                // Override chrome property
-                window.chrome = {
-                    runtime: {},
-                };
-
-                // Mock permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            """)
-
-            page = await context.new_page()
+            if reuse_context:
+                page = await (await self._get_shared_context(user_agent)).new_page()
+            else:
+                # Create isolated context for this request
+                context = await self._new_context(user_agent)
+                page = await context.new_page()
 
             yield page
 
         finally:
-            # Clean up: close page and context to prevent memory leaks
+            # Clean up: close page (and any isolated context) to prevent memory leaks
             if page:
                 try:
                     await page.close()
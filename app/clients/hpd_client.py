@@ -19,7 +19,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from sodapy import Socrata
 
 from ..config import get_settings
-from ..utils import sanitize_soql_value
+from ..utils import sanitize_soql_value, BOROUGH_IDS
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,7 @@ NYC_OPENDATA_DOMAIN = "data.cityofnewyork.us"
 HPD_VIOLATIONS_DATASET = "wvxf-dwi5"
 
 # Valid borough IDs
-VALID_BOROUGH_IDS = frozenset(('1', '2', '3', '4', '5'))
+VALID_BOROUGH_IDS = frozenset(BOROUGH_IDS.values())
 
 
 @dataclass
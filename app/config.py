@@ -27,6 +27,7 @@ class Settings(BaseSettings):
     dob_bis_base_url: str = "http://a810-bisweb.nyc.gov/bisweb"
     dob_scrape_timeout_ms: int = 30000
     dob_retry_count: int = 2
+    dob_max_concurrency: int = 4  # Max concurrent DOB BIS fetches
 
     # Browser Settings
     browser_headless: bool = True
@@ -39,7 +40,10 @@ class Settings(BaseSettings):
 
     # Cache Settings
     cache_ttl_seconds: int = 86400  # 24 hours
+    cache_bbl_ttl_seconds: int = 604800  # 7 days - address->BBL mapping is stable
     cache_directory: str = ".cache"
+    cache_shards: int = 8  # diskcache FanoutCache shards (parallel writers)
+    cache_memory_max_entries: int = 1024  # In-process LRU in front of disk cache (0 disables)
 
     # Rate Limiting
     rate_limit_requests_per_second: float = 1.0
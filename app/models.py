@@ -3,6 +3,7 @@
 import re
 from datetime import datetime, date, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Optional, List
 
 from pydantic import BaseModel, Field, field_validator
@@ -109,6 +110,16 @@ class AddressRequest(BaseModel):
         """Return formatted address string (already normalized by validators)."""
         return f"{self.house_number} {self.street}, {self.borough.value.upper()}"
 
+    @cached_property
+    def cache_key(self) -> str:
+        """
+        Return canonical address key (computed once per request).
+
+        Used for every cache entry tied to the address (analysis, agent
+        response, BBL) so each layer agrees on the same normalized form.
+        """
+        return f"{self.house_number}|{self.street}|{self.borough.value.upper()}"
+
     @property
     def borough_code(self) -> int:
         """Return DOB borough code."""
@@ -182,6 +193,19 @@ class AnalysisResponse(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+# Fixed fragments of the agent response template
+_AGENT_SCORE_PREFIX = "Score: "
+_AGENT_VACATE = "/100. Signals: Vacate Order ("
+_AGENT_SWO = "), Stop Work Order ("
+_AGENT_311 = "), 311 Complaints ("
+_AGENT_DOB = "), DOB Violations ("
+_AGENT_HPD = "), HPD Violations ("
+_AGENT_HPD_CLASS_C = ", Class C: "
+_AGENT_STATUS = "). Status: "
+_AGENT_PARTIAL = ". [PARTIAL DATA]"
+_AGENT_YES_NO = ("NO", "YES")
+
+
 class AgentResponse(BaseModel):
     """Minified response for /v1/agent endpoint (LLM optimized)."""
 
@@ -190,27 +214,26 @@ class AgentResponse(BaseModel):
     @classmethod
     def from_analysis(cls, analysis: AnalysisResponse) -> "AgentResponse":
         """Create minified agent response from full analysis."""
-        vacate_str = "YES" if analysis.signals.vacate_order else "NO"
-        swo_str = "YES" if analysis.signals.stop_work_order else "NO"
+        signals = analysis.signals
 
         hpd_total = (
-            analysis.signals.hpd_class_a_count +
-            analysis.signals.hpd_class_b_count +
-            analysis.signals.hpd_class_c_count
-        )
-
-        response = (
-            f"Score: {analysis.distress_score}/100. "
-            f"Signals: Vacate Order ({vacate_str}), "
-            f"Stop Work Order ({swo_str}), "
-            f"311 Complaints ({analysis.signals.complaints_311_count}), "
-            f"DOB Violations ({analysis.signals.dob_violations}), "
-            f"HPD Violations ({hpd_total}, Class C: {analysis.signals.hpd_class_c_count}). "
-            f"Status: {analysis.distress_level.value}."
+            signals.hpd_class_a_count +
+            signals.hpd_class_b_count +
+            signals.hpd_class_c_count
         )
 
-        if analysis.partial_data:
-            response += " [PARTIAL DATA]"
+        # Single join over fixed template fragments (cheaper than a chain of f-strings)
+        response = "".join((
+            _AGENT_SCORE_PREFIX, str(analysis.distress_score),
+            _AGENT_VACATE, _AGENT_YES_NO[signals.vacate_order],
+            _AGENT_SWO, _AGENT_YES_NO[signals.stop_work_order],
+            _AGENT_311, str(signals.complaints_311_count),
+            _AGENT_DOB, str(signals.dob_violations),
+            _AGENT_HPD, str(hpd_total),
+            _AGENT_HPD_CLASS_C, str(signals.hpd_class_c_count),
+            _AGENT_STATUS, analysis.distress_level.value,
+            _AGENT_PARTIAL if analysis.partial_data else ".",
+        ))
 
         return cls(response=response)
 
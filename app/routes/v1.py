@@ -5,13 +5,14 @@ Main endpoints for the NYC Distress Signal API.
 """
 
 import asyncio
+import heapq
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, Response, status, Query
 
 from collections import defaultdict
-from typing import List
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar
 
 from ..models import (
     AddressRequest,
@@ -25,7 +26,7 @@ from ..models import (
     MonthlySummary,
 )
 from ..clients.nyc_311_client import get_311_client
-from ..clients.hpd_client import get_hpd_client
+from ..clients.hpd_client import HPDData, get_hpd_client
 from ..scrapers.dob_scraper import get_dob_scraper
 from ..services.scoring import get_scorer, HPDDataInput
 from ..services.geocoder import get_geocoder
@@ -35,25 +36,47 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1", tags=["v1"])
 
+T = TypeVar("T")
 
-async def _perform_analysis(address: AddressRequest) -> AnalysisResponse:
+
+async def _safe(
+    coro: Awaitable[T],
+    source: str,
+    error_factory: Callable[[str], T],
+) -> T:
+    """
+    Await a data-source fetch, converting any exception into an error result.
+
+    Lets the concurrent fetches be gathered without return_exceptions and
+    post-hoc isinstance checks.
+    """
+    try:
+        return await coro
+    except Exception as e:
+        logger.error(f"{source} error: {e}")
+        return error_factory(str(e))
+
+
+async def _perform_analysis(
+    address: AddressRequest,
+) -> Tuple[AnalysisResponse, Optional[bytes]]:
     """
     Perform full property distress analysis.
 
     This is the core logic shared between /analyze and /agent endpoints.
+
+    Returns:
+        Tuple of (analysis, JSON payload). The payload is the exact bytes
+        written to the cache for a fresh analysis, or None on a cache hit.
     """
     cache_service = get_cache_service()
 
     # Check cache first
-    cached_result = cache_service.get(
-        address.house_number,
-        address.street,
-        address.borough.value,
-    )
+    cached_result = cache_service.get(address.cache_key)
 
     if cached_result:
         logger.info(f"Returning cached result for: {address.formatted_address}")
-        return cached_result
+        return cached_result, None
 
     # Fetch data from all sources concurrently
     logger.info(f"Analyzing property: {address.formatted_address}")
@@ -63,15 +86,21 @@ async def _perform_analysis(address: AddressRequest) -> AnalysisResponse:
     hpd_client = get_hpd_client()
     geocoder = get_geocoder()
 
-    # First, get BBL for accurate HPD lookup
-    geo_result = await geocoder.lookup(
-        address.house_number,
-        address.street,
-        address.borough,
-    )
+    # First, get BBL for accurate HPD lookup (cached long-term, BBLs rarely change)
+    bbl = cache_service.get_bbl(address.cache_key)
+
+    if bbl is None:
+        geo_result = await geocoder.lookup(
+            address.house_number,
+            address.street,
+            address.borough,
+        )
+
+        bbl = geo_result.bbl if geo_result.is_valid else None
+        logger.info(f"Geocoded to BBL: {bbl}")
 
-    bbl = geo_result.bbl if geo_result.is_valid else None
-    logger.info(f"Geocoded to BBL: {bbl}")
+        if bbl:
+            cache_service.set_bbl(address.cache_key, bbl)
 
     # Run data fetches concurrently
     nyc_311_task = client_311.fetch_complaints(
@@ -96,50 +125,31 @@ async def _perform_analysis(address: AddressRequest) -> AnalysisResponse:
             str(address.borough_code),
         )
 
-    # Wait for all to complete
+    # Wait for all to complete (failures come back as error-carrying results)
     nyc_311_data, dob_status, hpd_data = await asyncio.gather(
-        nyc_311_task,
-        dob_task,
-        hpd_task,
-        return_exceptions=True,
+        _safe(nyc_311_task, "311 API", lambda msg: NYC311Data(error=msg)),
+        _safe(dob_task, "DOB scraper", lambda msg: DOBStatus(error=msg)),
+        _safe(hpd_task, "HPD API", lambda msg: HPDData(error=msg)),
     )
 
-    # Handle exceptions
-    if isinstance(nyc_311_data, Exception):
-        logger.error(f"311 API error: {nyc_311_data}")
-        nyc_311_data = NYC311Data(error=str(nyc_311_data))
-
-    if isinstance(dob_status, Exception):
-        logger.error(f"DOB scraper error: {dob_status}")
-        dob_status = DOBStatus(error=str(dob_status))
-
     # Convert HPD data to scoring input
-    hpd_input = None
-    if isinstance(hpd_data, Exception):
-        logger.error(f"HPD API error: {hpd_data}")
-        hpd_input = HPDDataInput(error=str(hpd_data))
-    else:
-        hpd_input = HPDDataInput(
-            class_a_count=hpd_data.class_a_count,
-            class_b_count=hpd_data.class_b_count,
-            class_c_count=hpd_data.class_c_count,
-            open_violations=hpd_data.open_violations,
-            error=hpd_data.error,
-        )
+    hpd_input = HPDDataInput(
+        class_a_count=hpd_data.class_a_count,
+        class_b_count=hpd_data.class_b_count,
+        class_c_count=hpd_data.class_c_count,
+        open_violations=hpd_data.open_violations,
+        error=hpd_data.error,
+    )
 
     # Compute score with all data sources
     scorer = get_scorer()
     result = scorer.analyze(address, dob_status, nyc_311_data, hpd_input, bbl)
 
-    # Cache the result
-    cache_service.set(
-        address.house_number,
-        address.street,
-        address.borough.value,
-        result,
-    )
+    # Serialize once - the same bytes are cached and returned to the client
+    payload = result.model_dump_json().encode()
+    cache_service.set_raw(address.cache_key, payload, result)
 
-    return result
+    return result, payload
 
 
 @router.post(
@@ -171,15 +181,18 @@ async def _perform_analysis(address: AddressRequest) -> AnalysisResponse:
     ```
     """,
 )
-async def analyze_property(address: AddressRequest) -> AnalysisResponse:
+async def analyze_property(address: AddressRequest) -> Response:
     """
     Analyze a NYC property for distress signals.
 
     Returns full analysis with distress score, signals, and summary.
     """
     try:
-        result = await _perform_analysis(address)
-        return result
+        result, payload = await _perform_analysis(address)
+        # Serialize once with pydantic-core instead of re-validating via response_model
+        if payload is None:
+            payload = result.model_dump_json()
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         logger.exception(f"Error analyzing property: {e}")
@@ -220,8 +233,22 @@ async def analyze_property_agent(address: AddressRequest) -> AgentResponse:
     Reduces token count for AI agent consumption.
     """
     try:
-        full_result = await _perform_analysis(address)
-        return AgentResponse.from_analysis(full_result)
+        cache_service = get_cache_service()
+
+        cached_response = cache_service.get_agent_response(address.cache_key)
+        if cached_response:
+            logger.info(f"Returning cached agent result for: {address.formatted_address}")
+            return AgentResponse(response=cached_response)
+
+        full_result, _ = await _perform_analysis(address)
+        agent_response = AgentResponse.from_analysis(full_result)
+
+        cache_service.set_agent_response(
+            address.cache_key,
+            agent_response.response,
+        )
+
+        return agent_response
 
     except Exception as e:
         logger.exception(f"Error analyzing property for agent: {e}")
@@ -244,11 +271,7 @@ async def clear_cache(address: AddressRequest) -> dict:
     """Clear cached result for a specific address."""
     cache_service = get_cache_service()
 
-    deleted = cache_service.delete(
-        address.house_number,
-        address.street,
-        address.borough.value,
-    )
+    deleted = cache_service.delete(address.cache_key)
 
     if deleted:
         return {"message": "Cache entry deleted", "address": address.formatted_address}
@@ -308,7 +331,7 @@ def _aggregate_monthly(events: List[TimelineEvent]) -> List[MonthlySummary]:
 async def get_property_timeline(
     address: AddressRequest,
     limit: int = Query(default=500, ge=1, le=500, description="Max events to return"),
-) -> TimelineResponse:
+) -> Response:
     """
     Get full historical timeline for a property.
 
@@ -356,12 +379,14 @@ async def get_property_timeline(
     else:
         all_events.extend(results[1])
 
-    # Sort all events by date descending
-    all_events.sort(key=lambda e: e.date if e.date != "Unknown" else "0000-00-00", reverse=True)
-
-    # Limit response size to prevent DoS
+    # Select the most recent events, limiting response size to prevent DoS.
+    # nlargest avoids a full sort when limit is much smaller than the total.
     total_before_limit = len(all_events)
-    all_events = all_events[:limit]
+    all_events = heapq.nlargest(
+        limit,
+        all_events,
+        key=lambda e: e.date if e.date and e.date != "Unknown" else "0000-00-00",
+    )
 
     # Calculate date range
     valid_dates = [e.date for e in all_events if e.date and e.date != "Unknown"]
@@ -371,7 +396,7 @@ async def get_property_timeline(
     # Aggregate by month
     monthly_summary = _aggregate_monthly(all_events)
 
-    return TimelineResponse(
+    timeline = TimelineResponse(
         address=address.formatted_address,
         events=all_events,
         monthly_summary=monthly_summary,
@@ -381,3 +406,5 @@ async def get_property_timeline(
         partial_data=partial_data or (total_before_limit > limit),  # Mark if truncated
         fetched_at=datetime.now(timezone.utc),
     )
+
+    return Response(content=timeline.model_dump_json(), media_type="application/json")
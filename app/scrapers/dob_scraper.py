@@ -11,19 +11,168 @@ import asyncio
 import logging
 import random
 import re
+import threading
 import time
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from bs4 import BeautifulSoup
-from playwright.async_api import TimeoutError as PlaywrightTimeout
+import httpx
+from playwright.async_api import Page, Route, TimeoutError as PlaywrightTimeout
+from selectolax.lexbor import LexborHTMLParser
 
 from ..browser_manager import get_browser_manager, USER_AGENTS
 from ..config import get_settings
 from ..models import DOBStatus, Borough, TimelineEvent, EventSource
+from ..utils import BOROUGH_IDS
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Upper bound for the jittered retry backoff
+RETRY_BACKOFF_CAP_SECONDS = 30
+
+# Resource types not needed for parsing - blocked to cut page load time
+BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font", "stylesheet"))
+
+# DOB BIS landmarks that indicate the page content has rendered
+CONTENT_READY_SELECTOR = "table, .noRecordsFound"
+CONTENT_WAIT_TIMEOUT_MS = 5000
+
+# Property profile pages show the BIN once rendered; shells without it are
+# checked for the "no records" notice instead of being parsed
+BIN_READY_SELECTOR = "text=BIN"
+BIN_WAIT_TIMEOUT_MS = 3000
+NO_RECORDS_SCRIPT = (
+    "() => !!document.body && "
+    "document.body.innerText.toLowerCase().includes('no records found')"
+)
+
+# Direct HTTP fetches are streamed so "no records" pages can be cut short
+STREAM_CHUNK_BYTES = 16 * 1024
+NO_RECORDS_MARKER = b"no records found"
+
+# Precompiled patterns (compiled once at import instead of per scrape)
+BIN_PATTERN = re.compile(r"BIN#?\s*:?\s*(\d{7})", re.IGNORECASE)
+DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")  # MM/DD/YYYY
+
+# Every keyword the status parser cares about, in one alternation so the
+# page is scanned once. Violation counts come first so "active violations: N"
+# is captured as a count rather than a bare "active" hit.
+PROFILE_KEYWORD_PATTERN = re.compile(
+    r"(?P<violations>(?:open|active)\s*violations?\s*[:=]?\s*(?P<count>\d+))"
+    r"|(?P<swo>stop\s*work\s*order|SWO|work\s*stop\s*order)"
+    r"|(?P<vacate>vacate\s*order|full\s*vacate|partial\s*vacate)"
+    r"|(?P<active>active|yes|in\s*effect)",
+    re.IGNORECASE,
+)
+
+# An order counts as active when an active/yes/in-effect marker follows it
+# on the same line within this many characters
+ACTIVE_MARKER_WINDOW = 100
+
+# Order mentions flagged as active within one decoded text node, e.g.
+# "Stop work issued 01/02/2024 - status ACTIVE"
+SWO_ACTIVE_TEXT_PATTERN = re.compile(r"stop\s*work.*active", re.IGNORECASE)
+VACATE_ACTIVE_TEXT_PATTERN = re.compile(r"vacate.*active", re.IGNORECASE)
+
+# Raw-HTML hints that a page may hold such a text node; the full document is
+# only parsed for text nodes when both are present
+ORDER_WORD_PATTERN = re.compile(r"stop|vacate", re.IGNORECASE)
+ACTIVE_WORD_PATTERN = re.compile(r"active", re.IGNORECASE)
+
+# Order phrases that mark a Stop Work / Vacate order when they lead a table
+# cell's text. Matched on the raw markup like the rest of the keyword scan.
+SWO_CELL_PATTERN = re.compile(
+    r"<td[^>]*>[^<]*(?:stop\s*work\s*order|SWO|work\s*stop\s*order)",
+    re.IGNORECASE,
+)
+VACATE_CELL_PATTERN = re.compile(
+    r"<td[^>]*>[^<]*(?:vacate\s*order|full\s*vacate|partial\s*vacate|vacate[^<]*active)",
+    re.IGNORECASE,
+)
+
+# Table boundaries for _table_region (any tag case)
+TABLE_START_PATTERN = re.compile(r"<table", re.IGNORECASE)
+TABLE_END_PATTERN = re.compile(r"</table\s*>", re.IGNORECASE)
+
+# Keywords used to classify violation-history table cells
+EVENT_TYPE_KEYWORDS = ("ecb", "violation", "dob")
+EVENT_STATUS_KEYWORDS = ("open", "closed", "active", "resolved")
+
+
+def _table_region(html_content: str) -> str:
+    """
+    Slice HTML down to the span covering its tables.
+
+    DOB BIS pages carry scripts, styles, nav and footer boilerplate around
+    the data tables. Only the tables are walked, so parsing just this span
+    cuts tree construction time proportionally. Tag names are matched
+    case-insensitively.
+    """
+    first_table = TABLE_START_PATTERN.search(html_content)
+    if first_table is None:
+        return ""
+
+    start = first_table.start()
+    end = len(html_content)  # Unclosed table: keep everything after it
+    for closing in TABLE_END_PATTERN.finditer(html_content, first_table.end()):
+        end = closing.end()
+
+    return html_content[start:end]
+
+
+def _first_active_order_texts(html_content: str) -> List[str]:
+    """
+    Return the first text node matching each active-order pattern.
+
+    Text nodes come from the parsed document, so entities such as &nbsp;
+    are decoded before matching.
+    """
+    if not (
+        ORDER_WORD_PATTERN.search(html_content)
+        and ACTIVE_WORD_PATTERN.search(html_content)
+    ):
+        return []
+
+    pending = [SWO_ACTIVE_TEXT_PATTERN, VACATE_ACTIVE_TEXT_PATTERN]
+    texts: List[str] = []
+    for node in LexborHTMLParser(html_content).root.traverse(include_text=True):
+        if node.tag != "-text":
+            continue
+        text = node.text_content
+        for pattern in list(pending):
+            if pattern.search(text):
+                pending.remove(pattern)
+                texts.append(text)
+        if not pending:
+            break
+    return texts
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for assets the scraper never reads (images, fonts, CSS)."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _wait_for_content(page: Page) -> None:
+    """
+    Wait for DOB BIS landmark elements instead of a fixed delay.
+
+    A timeout is not fatal - whatever has rendered is still parsed.
+    """
+    try:
+        await page.wait_for_selector(
+            CONTENT_READY_SELECTOR,
+            state="attached",
+            timeout=CONTENT_WAIT_TIMEOUT_MS,
+        )
+    except PlaywrightTimeout:
+        logger.debug("DOB BIS content landmark not found before timeout")
+
 
 class CircuitBreaker:
     """
@@ -33,6 +182,10 @@ class CircuitBreaker:
     - CLOSED: Normal operation
     - OPEN: Failing, skip requests for cooldown period
     - HALF_OPEN: Testing if service recovered
+
+    State transitions are guarded by a lock and timed with the monotonic
+    clock, so concurrent scrapes and wall-clock adjustments can't corrupt
+    the failure count or cooldown.
     """
 
     def __init__(
@@ -43,55 +196,65 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.cooldown_seconds = cooldown_seconds
         self.consecutive_failures = 0
-        self.last_failure_time: Optional[float] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic()
         self.state = "CLOSED"
+        self._open_until: Optional[float] = None  # time.monotonic() deadline
+        self._lock = threading.Lock()
 
     def record_success(self) -> None:
         """Record a successful request."""
-        self.consecutive_failures = 0
-        self.state = "CLOSED"
+        with self._lock:
+            self.consecutive_failures = 0
+            self.state = "CLOSED"
+            self._open_until = None
         logger.debug("Circuit breaker: recorded success, state=CLOSED")
 
     def record_failure(self) -> None:
         """Record a failed request."""
-        self.consecutive_failures += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_failure_time = time.monotonic()
+
+            opened = self.consecutive_failures >= self.failure_threshold
+            if opened:
+                self.state = "OPEN"
+                self._open_until = self.last_failure_time + self.cooldown_seconds
+            failures = self.consecutive_failures
 
-        if self.consecutive_failures >= self.failure_threshold:
-            self.state = "OPEN"
+        if opened:
             logger.warning(
-                f"Circuit breaker OPEN: {self.consecutive_failures} consecutive failures. "
+                f"Circuit breaker OPEN: {failures} consecutive failures. "
                 f"Skipping DOB for {self.cooldown_seconds}s"
             )
 
     def is_available(self) -> bool:
         """Check if service should be called."""
+        # Fast path: no lock needed to observe the common CLOSED state
         if self.state == "CLOSED":
             return True
 
-        if self.state == "OPEN":
-            # Check if cooldown has passed
-            if self.last_failure_time:
-                elapsed = time.time() - self.last_failure_time
-                if elapsed >= self.cooldown_seconds:
-                    self.state = "HALF_OPEN"
-                    logger.info("Circuit breaker: cooldown passed, state=HALF_OPEN")
-                    return True
-            return False
-
-        # HALF_OPEN: allow one request through
+        with self._lock:
+            if self.state == "OPEN":
+                # Check if cooldown has passed
+                if self._open_until is None or time.monotonic() < self._open_until:
+                    return False
+                self.state = "HALF_OPEN"
+                logger.info("Circuit breaker: cooldown passed, state=HALF_OPEN")
+
+        # HALF_OPEN: allow requests through to test recovery
         return True
 
     def get_status(self) -> dict:
         """Get circuit breaker status."""
-        return {
-            "state": self.state,
-            "consecutive_failures": self.consecutive_failures,
-            "cooldown_remaining": max(
-                0,
-                self.cooldown_seconds - (time.time() - (self.last_failure_time or 0))
-            ) if self.state == "OPEN" else 0,
-        }
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "cooldown_remaining": max(
+                    0,
+                    self._open_until - time.monotonic()
+                ) if self.state == "OPEN" and self._open_until is not None else 0,
+            }
 
 
 # Global circuit breaker instance
@@ -108,17 +271,12 @@ class DOBScraper:
 
     def __init__(self):
         self._settings = get_settings()
-
-    def _get_borough_code(self, borough: Borough) -> str:
-        """Convert Borough enum to DOB BIS borough code."""
-        codes = {
-            Borough.MANHATTAN: "1",
-            Borough.BRONX: "2",
-            Borough.BROOKLYN: "3",
-            Borough.QUEENS: "4",
-            Borough.STATEN_ISLAND: "5",
-        }
-        return codes[borough]
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Bulkhead: bound concurrent in-flight DOB BIS fetches
+        self._dob_semaphore = asyncio.Semaphore(self._settings.dob_max_concurrency)
+        # In-flight scrapes per address, shared by concurrent callers
+        self._inflight_status: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self._inflight_history: Dict[Tuple[str, str, str], asyncio.Task] = {}
 
     def _build_search_url(
         self,
@@ -128,7 +286,7 @@ class DOBScraper:
     ) -> str:
         """Build DOB BIS property search URL."""
         base_url = self._settings.dob_bis_base_url
-        borough_code = self._get_borough_code(borough)
+        borough_code = BOROUGH_IDS[borough]
 
         # Clean inputs
         house_num = house_number.strip().upper()
@@ -158,93 +316,80 @@ class DOBScraper:
         Returns:
             DOBStatus with extracted data
         """
-        soup = BeautifulSoup(html_content, "lxml")
+        tree = LexborHTMLParser(_table_region(html_content))
         status = DOBStatus()
 
         try:
             # Extract BIN (Building Identification Number)
-            bin_match = re.search(r"BIN#?\s*:?\s*(\d{7})", html_content, re.IGNORECASE)
+            bin_match = BIN_PATTERN.search(html_content)
             if bin_match:
                 status.bin_number = bin_match.group(1)
 
-            # Look for violations section
-            # DOB BIS typically shows "Open Violations" count
-            violations_pattern = re.compile(
-                r"(?:open|active)\s*violations?\s*[:=]?\s*(\d+)",
-                re.IGNORECASE
-            )
-            violations_match = violations_pattern.search(html_content)
-            if violations_match:
-                status.open_violations = int(violations_match.group(1))
-
-            # Alternative: Count violation rows in table
-            violation_tables = soup.find_all("table", string=re.compile(r"violation", re.I))
-            if not violations_match and violation_tables:
-                # Count table rows that appear to be violations
-                for table in violation_tables:
-                    rows = table.find_all("tr")
-                    # Subtract header row
-                    status.open_violations = max(0, len(rows) - 1)
-
-            # Check for Stop Work Order
-            swo_patterns = [
-                r"stop\s*work\s*order",
-                r"SWO",
-                r"work\s*stop\s*order",
-            ]
-            for pattern in swo_patterns:
-                if re.search(pattern, html_content, re.IGNORECASE):
-                    # Check if it's marked as active/yes
-                    swo_section = re.search(
-                        rf"({pattern})[^\n]{{0,100}}(active|yes|in\s*effect)",
-                        html_content,
-                        re.IGNORECASE,
-                    )
-                    if swo_section:
-                        status.stop_work_order = True
-                        break
-                    # Also check for SWO in a table or listing
-                    if re.search(rf"<td[^>]*>[^<]*{pattern}", html_content, re.IGNORECASE):
-                        status.stop_work_order = True
-                        break
-
-            # Check for Vacate Order
-            vacate_patterns = [
-                r"vacate\s*order",
-                r"full\s*vacate",
-                r"partial\s*vacate",
-                r"vacate.*active",
-            ]
-            for pattern in vacate_patterns:
-                if re.search(pattern, html_content, re.IGNORECASE):
-                    vacate_section = re.search(
-                        rf"({pattern})[^\n]{{0,100}}(active|yes|in\s*effect)",
-                        html_content,
-                        re.IGNORECASE,
-                    )
-                    if vacate_section:
-                        status.vacate_order = True
-                        break
-                    # Check table cells
-                    if re.search(rf"<td[^>]*>[^<]*{pattern}", html_content, re.IGNORECASE):
-                        status.vacate_order = True
-                        break
-
-            # Additional check: look for specific DOB BIS page elements
-            # that indicate active orders
-            active_order_indicators = [
-                soup.find(string=re.compile(r"stop\s*work.*active", re.I)),
-                soup.find(string=re.compile(r"vacate.*active", re.I)),
-                soup.find("td", class_="status", string=re.compile(r"SWO|vacate", re.I)),
-            ]
-
-            for indicator in active_order_indicators:
-                if indicator:
-                    text = str(indicator).lower()
-                    if "stop" in text or "swo" in text:
+            # One scan for the violations count and Stop Work / Vacate orders
+            # followed by an active/yes/in-effect marker
+            violations_found = False
+            last_order_end = {"swo": -1, "vacate": -1}
+
+            for match in PROFILE_KEYWORD_PATTERN.finditer(html_content):
+                kind = match.lastgroup
+                if kind == "violations":
+                    # DOB BIS typically shows "Open Violations" count
+                    if not violations_found:
+                        status.open_violations = int(match.group("count"))
+                        violations_found = True
+                    if match.group(0)[0] not in "aA":
+                        continue
+                    # "Active violations" also counts as an active marker
+                elif kind != "active":
+                    last_order_end[kind] = match.end()
+                    continue
+
+                start = match.start()
+                for order, end in last_order_end.items():
+                    if (
+                        end != -1
+                        and start - end <= ACTIVE_MARKER_WINDOW
+                        and "\n" not in html_content[end:start]
+                    ):
+                        if order == "swo":
+                            status.stop_work_order = True
+                        else:
+                            status.vacate_order = True
+
+            # Alternative: Count violation rows in tables labelled as violations
+            if not violations_found:
+                for table in tree.css("table"):
+                    caption = table.css_first("caption")
+                    label = caption.text() if caption else table.text(deep=False)
+                    if "violation" in label.lower():
+                        rows = table.css("tr")
+                        # Subtract header row
+                        status.open_violations = max(0, len(rows) - 1)
+
+            # Order mentions marked active within one text node; the node
+            # may name both order types
+            for text in _first_active_order_texts(html_content):
+                text = text.lower()
+                if "stop" in text or "swo" in text:
+                    status.stop_work_order = True
+                if "vacate" in text:
+                    status.vacate_order = True
+
+            # An order listed in a table cell counts as present
+            if not status.stop_work_order and SWO_CELL_PATTERN.search(html_content):
+                status.stop_work_order = True
+            if not status.vacate_order and VACATE_CELL_PATTERN.search(html_content):
+                status.vacate_order = True
+
+            # The first status cell naming an order type counts on its own
+            for cell in tree.css("td.status"):
+                text = cell.text(deep=False).lower()
+                if "swo" in text or "vacate" in text:
+                    if "swo" in text or "stop" in text:
                         status.stop_work_order = True
                     if "vacate" in text:
                         status.vacate_order = True
+                    break
 
             status.scraped_at = datetime.now(timezone.utc)
 
@@ -254,6 +399,117 @@ class DOBScraper:
 
         return status
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client for direct BIS fetches."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    self._settings.dob_scrape_timeout_ms / 1000,
+                    connect=5.0,
+                ),
+                follow_redirects=True,
+            )
+        return self._http_client
+
+    async def _fetch_html(self, url: str, user_agent: str) -> Optional[str]:
+        """
+        Fetch a BIS page over plain HTTP (no browser).
+
+        Returns:
+            Page HTML, or None if the fetch failed or the page does not look
+            like a BIS response (caller should fall back to the browser)
+        """
+        body = bytearray()
+        try:
+            async with self._get_http_client().stream(
+                "GET",
+                url,
+                headers={"User-Agent": user_agent},
+            ) as response:
+                if response.status_code != 200:
+                    logger.debug(f"DOB HTTP fetch returned {response.status_code}, falling back to browser")
+                    return None
+
+                encoding = response.encoding or "utf-8"
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                    # Re-check the tail of the previous chunk so a marker split
+                    # across chunks is still seen
+                    window_start = max(0, len(body) - len(NO_RECORDS_MARKER) + 1)
+                    body.extend(chunk)
+                    if NO_RECORDS_MARKER in body[window_start:].lower():
+                        logger.debug("DOB HTTP response is a no-records page, stopping read")
+                        break
+        except httpx.HTTPError as e:
+            logger.debug(f"DOB HTTP fetch failed, falling back to browser: {e}")
+            return None
+
+        html_content = body.decode(encoding, errors="replace")
+        if "BIN" not in html_content and "no records found" not in html_content.lower():
+            logger.debug("DOB HTTP response missing BIS markers, falling back to browser")
+            return None
+
+        return html_content
+
+    async def _fetch_html_with_browser(self, url: str, user_agent: str) -> str:
+        """Fetch a BIS page by rendering it in the shared browser."""
+        browser_manager = await get_browser_manager()
+
+        async with browser_manager.get_page(user_agent=user_agent, reuse_context=True) as page:
+            await page.route("**/*", _block_heavy_resources)
+
+            # Navigate to the search URL
+            response = await page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=self._settings.dob_scrape_timeout_ms,
+            )
+
+            # Check for HTTP errors
+            if response and response.status >= 400:
+                raise Exception(f"HTTP {response.status}")
+
+            # Wait for the property profile to render; a page that never shows
+            # a BIN is only checked for the no-records notice
+            try:
+                await page.wait_for_selector(BIN_READY_SELECTOR, timeout=BIN_WAIT_TIMEOUT_MS)
+            except PlaywrightTimeout:
+                if await page.evaluate(NO_RECORDS_SCRIPT):
+                    return "No Records Found"
+                logger.debug("DOB BIS BIN not found before timeout")
+
+            return await page.content()
+
+    def _inflight_key(
+        self,
+        house_number: str,
+        street: str,
+        borough: Borough,
+    ) -> Tuple[str, str, str]:
+        """Build the in-flight deduplication key for an address."""
+        return (house_number.upper().strip(), street.upper().strip(), borough.value)
+
+    async def _deduplicated(
+        self,
+        inflight: Dict[Tuple[str, str, str], asyncio.Task],
+        key: Tuple[str, str, str],
+        coro_factory: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Run a scrape once per address, sharing the result with concurrent callers.
+
+        The shared task is shielded so one caller's cancellation does not
+        cancel the scrape for the others.
+        """
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight DOB scrape for {key}")
+
+        return await asyncio.shield(task)
+
     async def get_dob_status(
         self,
         house_number: str,
@@ -263,8 +519,7 @@ class DOBScraper:
         """
         Scrape DOB BIS for property status.
 
-        Implements retry logic with different user agents on failure.
-        Uses circuit breaker to handle extended DOB unavailability.
+        Concurrent requests for the same address share a single scrape.
 
         Args:
             house_number: Property house number
@@ -274,6 +529,24 @@ class DOBScraper:
         Returns:
             DOBStatus with scraped data or error information
         """
+        return await self._deduplicated(
+            self._inflight_status,
+            self._inflight_key(house_number, street, borough),
+            lambda: self._scrape_dob_status(house_number, street, borough),
+        )
+
+    async def _scrape_dob_status(
+        self,
+        house_number: str,
+        street: str,
+        borough: Borough,
+    ) -> DOBStatus:
+        """
+        Scrape DOB BIS for property status.
+
+        Implements retry logic with different user agents on failure.
+        Uses circuit breaker to handle extended DOB unavailability.
+        """
         # Check circuit breaker
         circuit_breaker = get_circuit_breaker()
         if not circuit_breaker.is_available():
@@ -286,61 +559,44 @@ class DOBScraper:
         url = self._build_search_url(house_number, street, borough)
         logger.info(f"Scraping DOB BIS: {url}")
 
-        browser_manager = await get_browser_manager()
         last_error: Optional[str] = None
-        used_agents: set = set()
+        ua_pool: List[str] = []
         success = False
 
         # Retry loop with different user agents
         for attempt in range(self._settings.dob_retry_count + 1):
             try:
                 # Select a different user agent for each retry attempt
-                available_agents = [ua for ua in USER_AGENTS if ua not in used_agents]
-                if not available_agents:
-                    available_agents = list(USER_AGENTS)
-                user_agent = random.choice(available_agents)
-                used_agents.add(user_agent)
+                if not ua_pool:
+                    ua_pool = list(USER_AGENTS)
+                    random.shuffle(ua_pool)
+                user_agent = ua_pool.pop()
                 logger.debug(f"Attempt {attempt + 1} using User-Agent: {user_agent[:50]}...")
 
-                async with browser_manager.get_page(user_agent=user_agent) as page:
-                    # Navigate to the search URL
-                    response = await page.goto(
-                        url,
-                        wait_until="networkidle",
-                        timeout=self._settings.dob_scrape_timeout_ms,
+                # BIS servlets are server-rendered - try a plain HTTP fetch first
+                async with self._dob_semaphore:
+                    html_content = await self._fetch_html(url, user_agent)
+                    if html_content is None:
+                        html_content = await self._fetch_html_with_browser(url, user_agent)
+
+                # Check for "no results" or error messages
+                if "no records found" in html_content.lower():
+                    logger.warning(f"No DOB records found for address")
+                    return DOBStatus(
+                        error="No property records found",
+                        scraped_at=datetime.now(timezone.utc),
                     )
 
-                    # Check for HTTP errors
-                    if response and response.status >= 400:
-                        raise Exception(f"HTTP {response.status}")
+                # Extract data from HTML
+                status = await self._extract_data_from_page(html_content)
 
-                    # Wait for content to load
-                    await page.wait_for_load_state("domcontentloaded")
-
-                    # Small delay for dynamic content
-                    await asyncio.sleep(1)
-
-                    # Get page content
-                    html_content = await page.content()
-
-                    # Check for "no results" or error messages
-                    if "no records found" in html_content.lower():
-                        logger.warning(f"No DOB records found for address")
-                        return DOBStatus(
-                            error="No property records found",
-                            scraped_at=datetime.now(timezone.utc),
-                        )
-
-                    # Extract data from HTML
-                    status = await self._extract_data_from_page(html_content)
-
-                    if status.error is None:
-                        logger.info(
-                            f"DOB scrape successful: violations={status.open_violations}, "
-                            f"SWO={status.stop_work_order}, vacate={status.vacate_order}"
-                        )
-                        circuit_breaker.record_success()
-                        return status
+                if status.error is None:
+                    logger.info(
+                        f"DOB scrape successful: violations={status.open_violations}, "
+                        f"SWO={status.stop_work_order}, vacate={status.vacate_order}"
+                    )
+                    circuit_breaker.record_success()
+                    return status
 
             except PlaywrightTimeout as e:
                 last_error = f"Timeout on attempt {attempt + 1}"
@@ -350,18 +606,41 @@ class DOBScraper:
                 last_error = str(e)
                 logger.warning(f"DOB scrape error (attempt {attempt + 1}): {e}")
 
-            # Wait before retry
+                # Client errors are permanent - only rate limiting (429) is worth retrying
+                if last_error.startswith("HTTP 4") and last_error != "HTTP 429":
+                    break
+
+            # Wait before retry (exponential backoff with full jitter)
             if attempt < self._settings.dob_retry_count:
-                await asyncio.sleep(2)
+                await asyncio.sleep(random.uniform(0, min(RETRY_BACKOFF_CAP_SECONDS, 2 ** attempt)))
 
         # All retries failed - record failure in circuit breaker
         circuit_breaker.record_failure()
-        logger.error(f"DOB scrape failed after {self._settings.dob_retry_count + 1} attempts")
+        logger.error(f"DOB scrape failed after {attempt + 1} attempts")
         return DOBStatus(
             error=f"Scrape failed: {last_error}",
             scraped_at=datetime.now(timezone.utc),
         )
 
+    async def get_many(
+        self,
+        addresses: List[Tuple[str, str, Borough]],
+    ) -> List[DOBStatus]:
+        """
+        Scrape DOB BIS for several properties concurrently.
+
+        Concurrency is bounded by the scraper's bulkhead semaphore.
+
+        Args:
+            addresses: (house_number, street, borough) tuples
+
+        Returns:
+            DOBStatus for each address, in input order
+        """
+        return await asyncio.gather(
+            *(self.get_dob_status(*address) for address in addresses)
+        )
+
     async def get_violation_history(
         self,
         house_number: str,
@@ -371,6 +650,8 @@ class DOBScraper:
         """
         Scrape DOB BIS for violation history.
 
+        Concurrent requests for the same address share a single scrape.
+
         Args:
             house_number: Property house number
             street: Street name
@@ -379,8 +660,21 @@ class DOBScraper:
         Returns:
             List of TimelineEvent objects for DOB violations
         """
+        return await self._deduplicated(
+            self._inflight_history,
+            self._inflight_key(house_number, street, borough),
+            lambda: self._scrape_violation_history(house_number, street, borough),
+        )
+
+    async def _scrape_violation_history(
+        self,
+        house_number: str,
+        street: str,
+        borough: Borough,
+    ) -> List[TimelineEvent]:
+        """Scrape the DOB BIS ECB violations page for an address."""
         base_url = self._settings.dob_bis_base_url
-        borough_code = self._get_borough_code(borough)
+        borough_code = BOROUGH_IDS[borough]
         house_num = house_number.strip().upper()
         street_name = street.strip().upper()
 
@@ -398,10 +692,12 @@ class DOBScraper:
         events: List[TimelineEvent] = []
 
         try:
-            async with browser_manager.get_page() as page:
+            async with self._dob_semaphore, browser_manager.get_page(reuse_context=True) as page:
+                await page.route("**/*", _block_heavy_resources)
+
                 response = await page.goto(
                     url,
-                    wait_until="networkidle",
+                    wait_until="domcontentloaded",
                     timeout=self._settings.dob_scrape_timeout_ms,
                 )
 
@@ -409,20 +705,19 @@ class DOBScraper:
                     logger.warning(f"DOB violation history returned HTTP {response.status}")
                     return events
 
-                await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(1)
+                await _wait_for_content(page)
 
                 html_content = await page.content()
-                soup = BeautifulSoup(html_content, "lxml")
+                tree = LexborHTMLParser(_table_region(html_content))
 
                 # Find violation tables
-                tables = soup.find_all("table")
+                tables = tree.css("table")
 
                 for table in tables:
-                    rows = table.find_all("tr")
+                    rows = table.css("tr")
 
                     for row in rows[1:]:  # Skip header row
-                        cells = row.find_all("td")
+                        cells = row.css("td")
                         if len(cells) >= 3:
                             # Try to extract date, type, status from cells
                             date_str = "Unknown"
@@ -430,28 +725,31 @@ class DOBScraper:
                             status = ""
                             description = ""
 
-                            for i, cell in enumerate(cells):
-                                text = cell.get_text(strip=True)
+                            for cell in cells:
+                                text = cell.text(strip=True)
+                                if not text:
+                                    continue
+                                text_lower = text.lower()
 
                                 # Try to detect date patterns
-                                date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", text)
+                                date_match = DATE_PATTERN.search(text)
                                 if date_match:
-                                    try:
-                                        parsed = datetime.strptime(date_match.group(1), "%m/%d/%Y")
-                                        date_str = parsed.strftime("%Y-%m-%d")
-                                    except ValueError:
-                                        pass
+                                    # Reformat MM/DD/YYYY directly - strptime is slow per cell
+                                    month, day, year = date_match.groups()
+                                    month, day = int(month), int(day)
+                                    if 1 <= month <= 12 and 1 <= day <= 31:
+                                        date_str = f"{year}-{month:02d}-{day:02d}"
 
                                 # Detect violation type
-                                if any(kw in text.lower() for kw in ["ecb", "violation", "dob"]):
+                                if any(kw in text_lower for kw in EVENT_TYPE_KEYWORDS):
                                     event_type = text[:50] if len(text) <= 50 else text[:47] + "..."
 
                                 # Detect status
-                                if any(kw in text.lower() for kw in ["open", "closed", "active", "resolved"]):
+                                if any(kw in text_lower for kw in EVENT_STATUS_KEYWORDS):
                                     status = text
 
                                 # Build description from other cells
-                                if text and len(text) > 5 and not date_match:
+                                if len(text) > 5 and not date_match:
                                     if description:
                                         description += " | " + text[:50]
                                     else:
@@ -475,6 +773,12 @@ class DOBScraper:
 
         return events
 
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
+
 
 # Singleton instance
 _scraper_instance: Optional[DOBScraper] = None
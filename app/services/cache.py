@@ -4,13 +4,15 @@ Caching Layer using diskcache.
 Provides persistent caching for API responses to minimize external requests.
 """
 
-import hashlib
-import json
 import logging
-from typing import Optional, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Tuple
 from datetime import datetime
 
 import diskcache
+import orjson
+import xxhash
 
 from ..config import get_settings
 from ..models import AnalysisResponse
@@ -22,13 +24,17 @@ class CacheService:
     """
     Disk-based cache service for storing analysis results.
 
-    Uses diskcache for persistent storage with TTL support.
+    Uses a sharded diskcache FanoutCache for persistent storage with TTL support, fronted by a
+    small in-process LRU of deserialized responses for hot addresses.
     """
 
     def __init__(self):
         self._settings = get_settings()
-        self._cache: Optional[diskcache.Cache] = None
+        self._cache: Optional[diskcache.FanoutCache] = None
         self._initialized = False
+        # In-process LRU: address_key -> (monotonic expiry, response)
+        self._mem: "OrderedDict[str, Tuple[float, AnalysisResponse]]" = OrderedDict()
+        self._mem_max = self._settings.cache_memory_max_entries
 
     def initialize(self) -> None:
         """Initialize the cache directory."""
@@ -36,12 +42,19 @@ class CacheService:
             return
 
         try:
-            self._cache = diskcache.Cache(
+            # Sharded across independent SQLite databases so concurrent
+            # writers don't serialize on a single database lock
+            self._cache = diskcache.FanoutCache(
                 self._settings.cache_directory,
-                size_limit=2**30,  # 1GB limit
+                shards=self._settings.cache_shards,
+                timeout=1,
+                size_limit=2**30,  # 1GB limit (total across shards)
             )
             self._initialized = True
-            logger.info(f"Cache initialized at {self._settings.cache_directory}")
+            logger.info(
+                f"Cache initialized at {self._settings.cache_directory} "
+                f"({self._settings.cache_shards} shards)"
+            )
         except Exception as e:
             logger.error(f"Failed to initialize cache: {e}")
             # Continue without cache - it's not critical
@@ -56,39 +69,58 @@ class CacheService:
                 logger.warning(f"Error closing cache: {e}")
             self._cache = None
             self._initialized = False
+        self._mem.clear()
 
     @property
     def is_ready(self) -> bool:
         """Check if cache is ready."""
         return self._initialized and self._cache is not None
 
-    def _make_key(self, house_number: str, street: str, borough: str) -> str:
+    def _make_key(self, address_key: str, prefix: str = "analysis") -> str:
         """
-        Generate a cache key from address components.
+        Generate a cache key from a canonical address key.
 
-        Uses MD5 hash for consistent, fixed-length keys.
+        Uses a non-cryptographic XXH3 hash for consistent, fixed-length keys.
+        The address key is already normalized by AddressRequest.cache_key.
         """
-        # Normalize inputs
-        normalized = f"{house_number.upper().strip()}|{street.upper().strip()}|{borough.upper()}"
+        # Hash for shorter, cleaner keys (equality only - no security requirement)
+        key_hash = xxhash.xxh3_128_hexdigest(address_key.encode())
+
+        return f"{prefix}:{key_hash}"
+
+    def _mem_get(self, address_key: str) -> Optional[AnalysisResponse]:
+        """Return a live entry from the in-process LRU, evicting it if expired."""
+        entry = self._mem.get(address_key)
+        if entry is None:
+            return None
 
-        # Hash for shorter, cleaner keys
-        key_hash = hashlib.md5(normalized.encode()).hexdigest()
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._mem[address_key]
+            return None
+
+        self._mem.move_to_end(address_key)
+        return response
+
+    def _mem_put(self, address_key: str, response: AnalysisResponse, ttl_seconds: float) -> None:
+        """Insert an entry into the in-process LRU, evicting the oldest if full."""
+        if self._mem_max <= 0 or ttl_seconds <= 0:
+            return
 
-        return f"analysis:{key_hash}"
+        self._mem[address_key] = (time.monotonic() + ttl_seconds, response)
+        self._mem.move_to_end(address_key)
+        if len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
 
     def get(
         self,
-        house_number: str,
-        street: str,
-        borough: str,
+        address_key: str,
     ) -> Optional[AnalysisResponse]:
         """
         Get cached analysis result.
 
         Args:
-            house_number: Property house number
-            street: Street name
-            borough: Borough name
+            address_key: Canonical address key (AddressRequest.cache_key)
 
         Returns:
             Cached AnalysisResponse or None if not found/expired
@@ -96,19 +128,34 @@ class CacheService:
         if not self.is_ready:
             return None
 
-        key = self._make_key(house_number, street, borough)
+        response = self._mem_get(address_key)
+        if response is not None:
+            logger.debug(f"Memory cache hit for: {address_key}")
+            return response
+
+        key = self._make_key(address_key)
 
         try:
-            cached_data = self._cache.get(key)
+            # FanoutCache returns a bare None (not a tuple) if the shard lock
+            # times out - treat that as a miss
+            result = self._cache.get(key, expire_time=True)
+            if result is None:
+                logger.debug(f"Cache read timed out for key: {key}")
+                return None
 
+            cached_data, expire_time = result
             if cached_data is None:
                 logger.debug(f"Cache miss for key: {key}")
                 return None
 
-            # Deserialize from JSON
-            data = json.loads(cached_data)
+            # Deserialize from JSON (accepts bytes, and str from older entries)
+            data = orjson.loads(cached_data)
             response = AnalysisResponse(**data)
 
+            # Keep in memory only for the remaining disk TTL
+            if expire_time is not None:
+                self._mem_put(address_key, response, expire_time - time.time())
+
             logger.info(f"Cache hit for key: {key}")
             return response
 
@@ -118,18 +165,17 @@ class CacheService:
 
     def set(
         self,
-        house_number: str,
-        street: str,
-        borough: str,
+        address_key: str,
         response: AnalysisResponse,
     ) -> bool:
         """
         Cache an analysis result.
 
+        Convenience wrapper around set_raw() for callers that do not
+        already hold a serialized response.
+
         Args:
-            house_number: Property house number
-            street: Street name
-            borough: Borough name
+            address_key: Canonical address key (AddressRequest.cache_key)
             response: Analysis response to cache
 
         Returns:
@@ -138,22 +184,59 @@ class CacheService:
         if not self.is_ready:
             return False
 
-        key = self._make_key(house_number, street, borough)
-
         try:
-            # Serialize to JSON
-            # Convert datetime to ISO format for JSON serialization
-            data = response.model_dump()
-            data["last_updated"] = data["last_updated"].isoformat()
+            # Serialize to JSON bytes (orjson handles datetimes and enums natively)
+            cached_data = orjson.dumps(response.model_dump(), option=orjson.OPT_NAIVE_UTC)
+        except Exception as e:
+            logger.warning(f"Error writing to cache: {e}")
+            return False
+
+        return self.set_raw(address_key, cached_data, response)
+
+    def set_raw(
+        self,
+        address_key: str,
+        response_bytes: bytes,
+        response_obj: Optional[AnalysisResponse] = None,
+    ) -> bool:
+        """
+        Cache an already-serialized analysis result.
+
+        Lets the API layer store the exact JSON bytes it returns to the
+        client, so the response is serialized only once.
 
-            cached_data = json.dumps(data)
+        Args:
+            address_key: Canonical address key (AddressRequest.cache_key)
+            response_bytes: JSON-encoded AnalysisResponse
+            response_obj: Optional deserialized response to warm the in-process LRU
+
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        if not self.is_ready:
+            return False
 
-            # Store with TTL
-            self._cache.set(
+        key = self._make_key(address_key)
+
+        try:
+            # Store with TTL (FanoutCache returns False if the shard lock times out)
+            stored = self._cache.set(
                 key,
-                cached_data,
+                response_bytes,
                 expire=self._settings.cache_ttl_seconds,
             )
+            if not stored:
+                logger.warning(f"Timed out writing cache key: {key}")
+                return False
+
+            if response_obj is not None:
+                self._mem_put(address_key, response_obj, self._settings.cache_ttl_seconds)
+            else:
+                self._mem.pop(address_key, None)
+
+            # The agent string is derived from the analysis - drop the old one
+            # so /v1/agent rebuilds it from this result
+            self._cache.delete(self._make_key(address_key, prefix="agent"))
 
             logger.info(f"Cached result for key: {key} (TTL: {self._settings.cache_ttl_seconds}s)")
             return True
@@ -162,14 +245,159 @@ class CacheService:
             logger.warning(f"Error writing to cache: {e}")
             return False
 
+    def get_agent_response(
+        self,
+        address_key: str,
+    ) -> Optional[str]:
+        """
+        Get the cached minified agent response string.
+
+        Stored alongside the full analysis so agent cache hits skip
+        rebuilding the response from the AnalysisResponse. Invalidated
+        whenever set_raw() stores a new analysis for the address.
+
+        Returns:
+            Cached agent response string or None if not found/expired
+        """
+        if not self.is_ready:
+            return None
+
+        key = self._make_key(address_key, prefix="agent")
+
+        try:
+            cached_data = self._cache.get(key)
+
+            if cached_data is None:
+                logger.debug(f"Cache miss for key: {key}")
+                return None
+
+            logger.info(f"Cache hit for key: {key}")
+            return cached_data
+
+        except Exception as e:
+            logger.warning(f"Error reading from cache: {e}")
+            return None
+
+    def set_agent_response(
+        self,
+        address_key: str,
+        response: str,
+    ) -> bool:
+        """
+        Cache a minified agent response string.
+
+        The string is derived from the cached analysis, so it expires
+        together with that entry rather than getting a fresh full TTL.
+        Nothing is stored when the analysis is no longer cached.
+
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        if not self.is_ready:
+            return False
+
+        key = self._make_key(address_key, prefix="agent")
+
+        try:
+            # A bare None means the analysis read timed out on its shard lock
+            result = self._cache.get(self._make_key(address_key), expire_time=True)
+            if result is None or result[0] is None:
+                logger.debug(f"No cached analysis to tie agent key to: {key}")
+                return False
+
+            expire_time = result[1]
+            if expire_time is None:
+                ttl_seconds = self._settings.cache_ttl_seconds
+            else:
+                ttl_seconds = expire_time - time.time()
+                if ttl_seconds <= 0:
+                    return False
+
+            # FanoutCache returns False if the shard lock times out
+            stored = self._cache.set(key, response, expire=ttl_seconds)
+            if not stored:
+                logger.warning(f"Timed out writing cache key: {key}")
+                return False
+
+            logger.info(f"Cached result for key: {key} (TTL: {ttl_seconds:.0f}s)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Error writing to cache: {e}")
+            return False
+
+    def get_bbl(
+        self,
+        address_key: str,
+    ) -> Optional[str]:
+        """
+        Get the cached BBL for an address.
+
+        Addresses rarely change BBL, so a hit lets callers skip the
+        geocoder round-trip entirely.
+
+        Returns:
+            Cached BBL string or None if not found/expired
+        """
+        if not self.is_ready:
+            return None
+
+        key = self._make_key(address_key, prefix="bbl")
+
+        try:
+            cached_data = self._cache.get(key)
+
+            if cached_data is None:
+                logger.debug(f"Cache miss for key: {key}")
+                return None
+
+            logger.info(f"Cache hit for key: {key}")
+            return cached_data
+
+        except Exception as e:
+            logger.warning(f"Error reading from cache: {e}")
+            return None
+
+    def set_bbl(
+        self,
+        address_key: str,
+        bbl: str,
+    ) -> bool:
+        """
+        Cache the geocoded BBL for an address.
+
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        if not self.is_ready:
+            return False
+
+        key = self._make_key(address_key, prefix="bbl")
+
+        try:
+            # FanoutCache returns False if the shard lock times out
+            stored = self._cache.set(
+                key,
+                bbl,
+                expire=self._settings.cache_bbl_ttl_seconds,
+            )
+            if not stored:
+                logger.warning(f"Timed out writing cache key: {key}")
+                return False
+
+            logger.info(f"Cached BBL for key: {key} (TTL: {self._settings.cache_bbl_ttl_seconds}s)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Error writing to cache: {e}")
+            return False
+
     def delete(
         self,
-        house_number: str,
-        street: str,
-        borough: str,
+        address_key: str,
     ) -> bool:
         """
-        Delete a cached entry.
+        Delete a cached entry (full analysis and agent response).
 
         Returns:
             True if deleted, False otherwise
@@ -177,9 +405,12 @@ class CacheService:
         if not self.is_ready:
             return False
 
-        key = self._make_key(house_number, street, borough)
+        key = self._make_key(address_key)
+        agent_key = self._make_key(address_key, prefix="agent")
+        self._mem.pop(address_key, None)
 
         try:
+            self._cache.delete(agent_key)
             deleted = self._cache.delete(key)
             if deleted:
                 logger.info(f"Deleted cache entry: {key}")
@@ -198,6 +429,8 @@ class CacheService:
         if not self.is_ready:
             return False
 
+        self._mem.clear()
+
         try:
             self._cache.clear()
             logger.info("Cache cleared")
@@ -215,6 +448,9 @@ class CacheService:
             return {
                 "status": "ready",
                 "size": len(self._cache),
+                "memory_entries": len(self._mem),
+                "shards": self._settings.cache_shards,
+                "volume_bytes": self._cache.volume(),
                 "directory": self._settings.cache_directory,
                 "ttl_seconds": self._settings.cache_ttl_seconds,
             }
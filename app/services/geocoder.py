@@ -10,8 +10,10 @@ import logging
 from typing import Optional, Dict, Any
 
 import httpx
+import orjson
 
 from ..models import Borough
+from ..utils import BOROUGH_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,18 @@ GEOSEARCH_BASE_URL = "https://geosearch.planninglabs.nyc/v2/search"
 class GeocoderResult:
     """Result from geocoder lookup."""
 
+    __slots__ = (
+        "bbl",
+        "bin_number",
+        "normalized_address",
+        "borough",
+        "block",
+        "lot",
+        "latitude",
+        "longitude",
+        "error",
+    )
+
     def __init__(
         self,
         bbl: Optional[str] = None,
@@ -53,26 +67,24 @@ class GeocoderResult:
 class NYCGeocoder:
     """Geocoder for NYC addresses using Planning Labs GeoSearch."""
 
-    def __init__(self):
-        self._client: Optional[httpx.AsyncClient] = None
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self._client = client
+        # Only clients created here are closed by close(); injected ones
+        # belong to the caller (e.g. the app lifespan)
+        self._owns_client = False
+
+    def set_client(self, client: httpx.AsyncClient) -> None:
+        """Use a shared, application-owned HTTP client for all lookups."""
+        self._client = client
+        self._owns_client = False
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """Get the HTTP client, creating one if none was provided or it was closed."""
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(timeout=15.0)
+            self._owns_client = True
         return self._client
 
-    def _get_borough_name(self, borough: Borough) -> str:
-        """Convert Borough enum to search string."""
-        mapping = {
-            Borough.MANHATTAN: "Manhattan",
-            Borough.BRONX: "Bronx",
-            Borough.BROOKLYN: "Brooklyn",
-            Borough.QUEENS: "Queens",
-            Borough.STATEN_ISLAND: "Staten Island",
-        }
-        return mapping[borough]
-
     async def lookup(
         self,
         house_number: str,
@@ -94,19 +106,22 @@ class NYCGeocoder:
             client = await self._get_client()
 
             # Build search query
-            borough_name = self._get_borough_name(borough)
+            borough_name = BOROUGH_NAMES[borough]
             query = f"{house_number} {street}, {borough_name}, NY"
 
             logger.info(f"Geocoding address: {query}")
 
-            # Make request to GeoSearch API
+            # Make request to GeoSearch API - only the best match is used, so
+            # ask for a single feature instead of parsing the full result page
             response = await client.get(
                 GEOSEARCH_BASE_URL,
-                params={"text": query},
+                params={"text": query, "size": 1},
             )
 
             response.raise_for_status()
-            data = response.json()
+            # Parse the raw bytes: orjson validates UTF-8 while parsing (with an
+            # ASCII fast path), so no separate decode or validation pass is needed
+            data = orjson.loads(response.content)
 
             # Parse response
             features = data.get("features", [])
@@ -127,11 +142,13 @@ class NYCGeocoder:
             pad_bbl = pad_data.get("bbl", "")
             pad_bin = pad_data.get("bin", "")
 
-            # Parse BBL (format: BBBBBBBLL - 10 digits)
-            bbl = pad_bbl if pad_bbl else None
-            borough_code = pad_bbl[0] if len(pad_bbl) >= 1 else None
-            block = pad_bbl[1:6] if len(pad_bbl) >= 6 else None
-            lot = pad_bbl[6:10] if len(pad_bbl) >= 10 else None
+            # Parse BBL (format: BBBBBBBLL - 10 digits); block and lot are only
+            # taken from a complete BBL
+            bbl = pad_bbl or None
+            if bbl and len(bbl) == 10:
+                block, lot = bbl[1:6], bbl[6:10]
+            else:
+                block = lot = None
 
             result = GeocoderResult(
                 bbl=bbl,
@@ -156,10 +173,11 @@ class NYCGeocoder:
             return GeocoderResult(error=str(e))
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
+        """Close the HTTP client if this geocoder created it."""
+        if self._owns_client and self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
+            self._owns_client = False
 
 
 # Singleton instance
@@ -6,8 +6,14 @@ This is the "alpha" - the proprietary scoring logic.
 """
 
 import logging
+import operator
+import time
+from bisect import bisect_left
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Tuple, Optional
+from typing import List, Sequence, Tuple, Optional
+
+import numpy as np
 
 from ..config import get_settings
 from ..models import (
@@ -21,10 +27,86 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Distinct signal combinations whose score/level/summary are memoized
+SCORE_MEMO_MAX_ENTRIES = 4096
+
+# Summary fragments
+_SIGNAL_VACATE = "Active Vacate Order"
+_SIGNAL_STOP_WORK = "Active Stop Work Order"
+_NO_SIGNALS = " RISK: No significant distress signals detected."
+
+_LEVEL_PREFIX = {
+    DistressLevel.CRITICAL: "CRITICAL RISK: ",
+    DistressLevel.HIGH: "HIGH RISK: ",
+    DistressLevel.MODERATE: "MODERATE RISK: ",
+    DistressLevel.LOW: "LOW RISK: ",
+}
+_LEVEL_SUFFIX = {
+    DistressLevel.CRITICAL: " found. Property shows severe distress indicators.",
+    DistressLevel.HIGH: " found. Property shows significant distress.",
+    DistressLevel.MODERATE: " found. Property warrants further investigation.",
+    DistressLevel.LOW: " found. Minor concerns only.",
+}
+
+# Upper bounds (inclusive) of each distress level below CRITICAL
+_LEVEL_THRESHOLDS = (25, 50, 75)
+_LEVELS = (
+    DistressLevel.LOW,
+    DistressLevel.MODERATE,
+    DistressLevel.HIGH,
+    DistressLevel.CRITICAL,
+)
+
+# last_updated is served from a clock refreshed at most this often
+TIMESTAMP_RESOLUTION_SECONDS = 0.1
+_timestamp: Optional[datetime] = None
+_timestamp_expires = 0.0
+
+
+def _coarse_utc_now() -> datetime:
+    """
+    Current UTC time, reused for up to TIMESTAMP_RESOLUTION_SECONDS.
+
+    Analyses completing within the same window share one datetime instead
+    of each building a timezone-aware object.
+    """
+    global _timestamp, _timestamp_expires
+    now = time.monotonic()
+    if _timestamp is None or now >= _timestamp_expires:
+        _timestamp = datetime.now(timezone.utc)
+        _timestamp_expires = now + TIMESTAMP_RESOLUTION_SECONDS
+    return _timestamp
+
+
+# Debug labels for each scored signal, in DistressScorer._weights order
+_SIGNAL_LABELS = (
+    "vacate order",
+    "HPD Class C violations",
+    "stop work order",
+    "HPD Class B violations",
+    "illegal conversion complaints",
+    "HPD Class A violations",
+    "heat/water complaints",
+    "DOB violations",
+    "noise complaints",
+)
+
+
+def _score_kernel(units: Tuple[int, ...], weights: Tuple[int, ...], max_score: int) -> int:
+    """
+    Weighted sum of signal units, capped at max_score.
+
+    Pure integer arithmetic with no logging or strings, kept separate from
+    the scorer so it can be reused for batch scoring.
+    """
+    return min(sum(map(operator.mul, units, weights)), max_score)
+
 
 # HPD Data class (avoiding circular import)
 class HPDDataInput:
     """Input data from HPD client."""
+    __slots__ = ("class_a_count", "class_b_count", "class_c_count", "open_violations", "error")
+
     def __init__(
         self,
         class_a_count: int = 0,
@@ -60,6 +142,21 @@ class DistressScorer:
 
     def __init__(self):
         self._settings = get_settings()
+        # Points per unit of each signal, in _SIGNAL_LABELS order
+        self._weights = (
+            self._settings.score_vacate_order,
+            40,
+            self._settings.score_stop_work_order,
+            20,
+            self._settings.score_illegal_conversion_bonus,
+            10,
+            self._settings.score_heat_water_per_complaint,
+            3,
+            2,
+        )
+        # Scoring is deterministic in the input signals, so repeated
+        # combinations reuse (score, level, summary), least recent first
+        self._outcomes: "OrderedDict[tuple, Tuple[int, DistressLevel, str]]" = OrderedDict()
 
     def _calculate_score(
         self,
@@ -73,75 +170,51 @@ class DistressScorer:
         Returns:
             Score between 0 and 100.
         """
-        score = 0
-
-        # Critical: Vacate Order (+50)
-        if dob_status.vacate_order:
-            score += self._settings.score_vacate_order
-            logger.debug(f"Added {self._settings.score_vacate_order} for vacate order")
-
-        # Critical: HPD Class C violation (+40) - Immediately Hazardous
-        if hpd_data and hpd_data.class_c_count > 0:
-            score += 40
-            logger.debug(f"Added 40 for {hpd_data.class_c_count} HPD Class C violations")
-
-        # High: Stop Work Order (+30)
-        if dob_status.stop_work_order:
-            score += self._settings.score_stop_work_order
-            logger.debug(f"Added {self._settings.score_stop_work_order} for stop work order")
-
-        # High: HPD Class B violations (+20 if 5+)
-        if hpd_data and hpd_data.class_b_count >= 5:
-            score += 20
-            logger.debug(f"Added 20 for {hpd_data.class_b_count} HPD Class B violations")
-
-        # Medium-High: Illegal Conversion complaints (+15 if > threshold)
-        if nyc_311_data.illegal_conversion_count > self._settings.score_illegal_conversion_threshold:
-            score += self._settings.score_illegal_conversion_bonus
-            logger.debug(
-                f"Added {self._settings.score_illegal_conversion_bonus} for "
-                f"{nyc_311_data.illegal_conversion_count} illegal conversion complaints"
-            )
-
-        # Medium: HPD Class A violations (+10 if 10+)
-        if hpd_data and hpd_data.class_a_count >= 10:
-            score += 10
-            logger.debug(f"Added 10 for {hpd_data.class_a_count} HPD Class A violations")
-
-        # Medium: Heat/Hot Water complaints (+5 each)
-        heat_water_score = (
-            nyc_311_data.heat_water_count *
-            self._settings.score_heat_water_per_complaint
+        if hpd_data:
+            class_a = hpd_data.class_a_count
+            class_b = hpd_data.class_b_count
+            class_c = hpd_data.class_c_count
+        else:
+            class_a = class_b = class_c = 0
+
+        # Units per signal, weighted by self._weights: threshold signals
+        # count 0/1, per-item signals count each item (DOB violations up to
+        # 5, noise complaints up to 5)
+        units = (
+            dob_status.vacate_order,
+            class_c > 0,
+            dob_status.stop_work_order,
+            class_b >= 5,
+            nyc_311_data.illegal_conversion_count > self._settings.score_illegal_conversion_threshold,
+            class_a >= 10,
+            nyc_311_data.heat_water_count,
+            min(dob_status.open_violations, 5),
+            min(nyc_311_data.noise_residential_count, 5),
         )
-        score += heat_water_score
-        if heat_water_score > 0:
-            logger.debug(
-                f"Added {heat_water_score} for "
-                f"{nyc_311_data.heat_water_count} heat/water complaints"
-            )
-
-        # Low-Medium: DOB violations (+3 each, up to 15)
-        violation_score = min(dob_status.open_violations * 3, 15)
-        score += violation_score
-        if violation_score > 0:
-            logger.debug(
-                f"Added {violation_score} for "
-                f"{dob_status.open_violations} DOB violations"
-            )
-
-        # Low: Noise complaints (+2 each, up to 10)
-        noise_score = min(nyc_311_data.noise_residential_count * 2, 10)
-        score += noise_score
-        if noise_score > 0:
-            logger.debug(
-                f"Added {noise_score} for "
-                f"{nyc_311_data.noise_residential_count} noise complaints"
+        final_score = _score_kernel(units, self._weights, self._settings.score_max)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Raw counts behind each signal (None for the order flags)
+            counts = (
+                None,
+                class_c,
+                None,
+                class_b,
+                nyc_311_data.illegal_conversion_count,
+                class_a,
+                nyc_311_data.heat_water_count,
+                dob_status.open_violations,
+                nyc_311_data.noise_residential_count,
             )
-
-        # Cap at maximum
-        final_score = min(score, self._settings.score_max)
-
-        logger.info(f"Calculated distress score: {final_score}")
+            for label, count, unit, weight in zip(_SIGNAL_LABELS, counts, units, self._weights):
+                if not unit:
+                    continue
+                if count is None:
+                    logger.debug("Added %d for %s", unit * weight, label)
+                else:
+                    logger.debug("Added %d for %d %s", unit * weight, count, label)
+
+        logger.info("Calculated distress score: %d", final_score)
         return final_score
 
     def _determine_level(self, score: int) -> DistressLevel:
@@ -153,14 +226,64 @@ class DistressScorer:
         51-75: HIGH
         76-100: CRITICAL
         """
-        if score <= 25:
-            return DistressLevel.LOW
-        elif score <= 50:
-            return DistressLevel.MODERATE
-        elif score <= 75:
-            return DistressLevel.HIGH
-        else:
-            return DistressLevel.CRITICAL
+        return _LEVELS[bisect_left(_LEVEL_THRESHOLDS, score)]
+
+    def analyze_batch(
+        self,
+        vacate: Sequence[bool],
+        stop_work: Sequence[bool],
+        open_violations: Sequence[int],
+        illegal_conversion: Sequence[int],
+        heat_water: Sequence[int],
+        noise: Sequence[int],
+        class_a: Sequence[int],
+        class_b: Sequence[int],
+        class_c: Sequence[int],
+    ) -> Tuple[np.ndarray, List[DistressLevel]]:
+        """
+        Score many properties at once from column arrays of signal counts.
+
+        Intended for bulk tools (portfolio scoring, backtesting) where the
+        per-property overhead of analyze() dominates. Uses the same weights
+        and level thresholds as analyze(); summaries are not generated.
+
+        Args:
+            vacate: Active Vacate Order flags
+            stop_work: Active Stop Work Order flags
+            open_violations: Open DOB violation counts
+            illegal_conversion: Illegal conversion complaint counts
+            heat_water: Heat/hot water complaint counts
+            noise: Residential noise complaint counts
+            class_a: HPD Class A violation counts
+            class_b: HPD Class B violation counts
+            class_c: HPD Class C violation counts
+
+        Returns:
+            Tuple of (int32 score array, distress level per property)
+        """
+        class_a = np.asarray(class_a, dtype=np.int32)
+        class_b = np.asarray(class_b, dtype=np.int32)
+        class_c = np.asarray(class_c, dtype=np.int32)
+        illegal_conversion = np.asarray(illegal_conversion, dtype=np.int32)
+
+        # One row per signal, in the same order as _calculate_score's units
+        units = np.stack((
+            np.asarray(vacate, dtype=np.bool_),
+            class_c > 0,
+            np.asarray(stop_work, dtype=np.bool_),
+            class_b >= 5,
+            illegal_conversion > self._settings.score_illegal_conversion_threshold,
+            class_a >= 10,
+            np.asarray(heat_water, dtype=np.int32),
+            np.minimum(np.asarray(open_violations, dtype=np.int32), 5),
+            np.minimum(np.asarray(noise, dtype=np.int32), 5),
+        )).astype(np.int32)
+
+        scores = np.asarray(self._weights, dtype=np.int32) @ units
+        np.minimum(scores, self._settings.score_max, out=scores)
+
+        level_indices = np.digitize(scores, _LEVEL_THRESHOLDS, right=True)
+        return scores, [_LEVELS[i] for i in level_indices]
 
     def _generate_summary(
         self,
@@ -171,44 +294,28 @@ class DistressScorer:
         hpd_data: Optional[HPDDataInput] = None,
     ) -> str:
         """Generate a human-readable summary of the analysis."""
-        signals = []
-
-        if dob_status.vacate_order:
-            signals.append("Active Vacate Order")
-
-        if hpd_data and hpd_data.class_c_count > 0:
-            signals.append(f"{hpd_data.class_c_count} HPD Class C (immediately hazardous) violations")
-
-        if dob_status.stop_work_order:
-            signals.append("Active Stop Work Order")
-
-        if hpd_data and hpd_data.class_b_count >= 5:
-            signals.append(f"{hpd_data.class_b_count} HPD Class B (hazardous) violations")
-
-        if nyc_311_data.illegal_conversion_count > self._settings.score_illegal_conversion_threshold:
-            signals.append(
-                f"{nyc_311_data.illegal_conversion_count} illegal conversion complaints"
-            )
-
-        if nyc_311_data.heat_water_count > 0:
-            signals.append(f"{nyc_311_data.heat_water_count} heat/water complaints")
-
-        if dob_status.open_violations > 0:
-            signals.append(f"{dob_status.open_violations} open DOB violations")
-
-        if not signals:
-            return f"{level.value} RISK: No significant distress signals detected."
-
-        signal_text = ", ".join(signals)
-
-        if level == DistressLevel.CRITICAL:
-            return f"CRITICAL RISK: {signal_text} found. Property shows severe distress indicators."
-        elif level == DistressLevel.HIGH:
-            return f"HIGH RISK: {signal_text} found. Property shows significant distress."
-        elif level == DistressLevel.MODERATE:
-            return f"MODERATE RISK: {signal_text} found. Property warrants further investigation."
-        else:
-            return f"LOW RISK: {signal_text} found. Minor concerns only."
+        class_b = hpd_data.class_b_count if hpd_data else 0
+        class_c = hpd_data.class_c_count if hpd_data else 0
+        illegal_conversions = nyc_311_data.illegal_conversion_count
+
+        # Fixed-order slots; absent signals are None and dropped by the join
+        signal_text = ", ".join(filter(None, (
+            _SIGNAL_VACATE if dob_status.vacate_order else None,
+            f"{class_c} HPD Class C (immediately hazardous) violations" if class_c > 0 else None,
+            _SIGNAL_STOP_WORK if dob_status.stop_work_order else None,
+            f"{class_b} HPD Class B (hazardous) violations" if class_b >= 5 else None,
+            f"{illegal_conversions} illegal conversion complaints"
+            if illegal_conversions > self._settings.score_illegal_conversion_threshold else None,
+            f"{nyc_311_data.heat_water_count} heat/water complaints"
+            if nyc_311_data.heat_water_count > 0 else None,
+            f"{dob_status.open_violations} open DOB violations"
+            if dob_status.open_violations > 0 else None,
+        )))
+
+        if not signal_text:
+            return level.value + _NO_SIGNALS
+
+        return _LEVEL_PREFIX[level] + signal_text + _LEVEL_SUFFIX[level]
 
     def analyze(
         self,
@@ -231,12 +338,6 @@ class DistressScorer:
         Returns:
             Complete analysis response
         """
-        # Calculate score
-        score = self._calculate_score(dob_status, nyc_311_data, hpd_data)
-
-        # Determine level
-        level = self._determine_level(score)
-
         # Check for partial data
         partial_data = bool(
             dob_status.error or
@@ -244,14 +345,44 @@ class DistressScorer:
             (hpd_data and hpd_data.error)
         )
 
-        # Generate summary
-        summary = self._generate_summary(score, level, dob_status, nyc_311_data, hpd_data)
+        # Every input that score, level and summary depend on
+        signal_key = (
+            dob_status.vacate_order,
+            dob_status.stop_work_order,
+            dob_status.open_violations,
+            nyc_311_data.illegal_conversion_count,
+            nyc_311_data.heat_water_count,
+            nyc_311_data.noise_residential_count,
+            hpd_data.class_a_count if hpd_data else 0,
+            hpd_data.class_b_count if hpd_data else 0,
+            hpd_data.class_c_count if hpd_data else 0,
+            partial_data,
+        )
+
+        outcome = self._outcomes.get(signal_key)
+        if outcome is not None:
+            self._outcomes.move_to_end(signal_key)
+            score, level, summary = outcome
+        else:
+            # Calculate score
+            score = self._calculate_score(dob_status, nyc_311_data, hpd_data)
+
+            # Determine level
+            level = self._determine_level(score)
+
+            # Generate summary
+            summary = self._generate_summary(score, level, dob_status, nyc_311_data, hpd_data)
+
+            if partial_data:
+                summary += " [Some data sources unavailable]"
 
-        if partial_data:
-            summary += " [Some data sources unavailable]"
+            self._outcomes[signal_key] = (score, level, summary)
+            if len(self._outcomes) > SCORE_MEMO_MAX_ENTRIES:
+                self._outcomes.popitem(last=False)
 
-        # Build signals object
-        signals = DistressSignals(
+        # Build signals object - every value below comes from validated models
+        # or the scorer itself, so construct without re-running validation
+        signals = DistressSignals.model_construct(
             dob_violations=dob_status.open_violations,
             stop_work_order=dob_status.stop_work_order,
             vacate_order=dob_status.vacate_order,
@@ -261,7 +392,7 @@ class DistressScorer:
             hpd_class_c_count=hpd_data.class_c_count if hpd_data else 0,
         )
 
-        return AnalysisResponse(
+        return AnalysisResponse.model_construct(
             address=address.formatted_address,
             bbl=bbl,
             distress_score=score,
@@ -269,7 +400,7 @@ class DistressScorer:
             summary=summary,
             signals=signals,
             partial_data=partial_data,
-            last_updated=datetime.now(timezone.utc),
+            last_updated=_coarse_utc_now(),
         )
 
 
@@ -6,7 +6,6 @@ Provides centralized implementations for:
 - Borough name/ID mappings
 """
 
-import re
 from typing import Optional
 
 from ..models import Borough
@@ -33,6 +32,21 @@ BOROUGH_IDS = {
 BOROUGH_NAME_TO_ENUM = {v.upper(): k for k, v in BOROUGH_NAMES.items()}
 BOROUGH_ID_TO_ENUM = {v: k for k, v in BOROUGH_IDS.items()}
 
+# Borough names pre-cased for each get_borough_name() format
+_BOROUGH_NAMES_BY_FORMAT = {
+    "title": BOROUGH_NAMES,
+    "upper": {k: v.upper() for k, v in BOROUGH_NAMES.items()},
+    "lower": {k: v.lower() for k, v in BOROUGH_NAMES.items()},
+}
+_UNKNOWN_BOROUGH_BY_FORMAT = {"title": "Unknown", "upper": "UNKNOWN", "lower": "unknown"}
+
+# Characters stripped from SoQL values: semicolons, dashes (SQL comments),
+# pipes, ampersands, dollar signs, and brackets. All ASCII, so they can be
+# deleted from UTF-8 bytes without touching multi-byte characters.
+_SOQL_STRIP = b";-|&$()[]{}"
+# Everything sanitize_soql_value rewrites (stripped characters plus quotes)
+_SOQL_DANGEROUS = frozenset(";-|&$()[]{}'")
+
 
 def sanitize_soql_value(value: str, max_length: int = 200) -> str:
     """
@@ -62,13 +76,19 @@ def sanitize_soql_value(value: str, max_length: int = 200) -> str:
     # Limit length to prevent buffer issues
     value = value[:max_length]
 
-    # Escape single quotes by doubling them (SoQL standard)
-    value = value.replace("'", "''")
+    # Fast path: most values have nothing to escape or strip
+    if _SOQL_DANGEROUS.isdisjoint(value):
+        return value.strip()
 
-    # Remove potentially dangerous characters for query injection
-    # Semicolons, double dashes (SQL comments), pipes, ampersands,
-    # dollar signs, and brackets
-    value = re.sub(r'[;\-\-\|\&\$\(\)\[\]\{\}]', '', value)
+    # Remove potentially dangerous characters for query injection, then
+    # escape single quotes by doubling them (SoQL standard). Both run as
+    # C-level passes over the UTF-8 bytes.
+    value = (
+        value.encode("utf-8", "surrogatepass")
+        .translate(None, _SOQL_STRIP)
+        .replace(b"'", b"''")
+        .decode("utf-8", "surrogatepass")
+    )
 
     return value.strip()
 
@@ -90,12 +110,12 @@ def get_borough_name(borough: Borough, format: str = "title") -> str:
         >>> get_borough_name(Borough.STATEN_ISLAND, format="upper")
         "STATEN ISLAND"
     """
-    name = BOROUGH_NAMES.get(borough, "Unknown")
+    if format not in _BOROUGH_NAMES_BY_FORMAT:
+        format = "title"
 
-    if format == "upper":
-        return name.upper()
-    elif format == "lower":
-        return name.lower()
+    name = _BOROUGH_NAMES_BY_FORMAT[format].get(borough)
+    if name is None:
+        return _UNKNOWN_BOROUGH_BY_FORMAT[format]
     return name
 
 
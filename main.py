@@ -12,6 +12,7 @@ import logging
 import time
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -32,6 +33,8 @@ from app.middleware.request_logging import RequestLoggingMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.browser_manager import BrowserManager
 from app.services.cache import get_cache_service
+from app.services.geocoder import get_geocoder
+from app.scrapers.dob_scraper import get_dob_scraper
 
 # Configure logging
 logging.basicConfig(
@@ -53,7 +56,7 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize browser pool and cache
+    - Startup: Initialize browser pool, cache and shared HTTP client
     - Shutdown: Clean up resources
     """
     global _browser_manager, _start_time
@@ -67,6 +70,15 @@ async def lifespan(app: FastAPI):
     cache_service.initialize()
     logger.info("Cache service initialized")
 
+    # One pooled HTTP/2 client for the app lifetime, so geocoder calls reuse
+    # connections instead of repeating TCP/TLS handshakes
+    http_client = httpx.AsyncClient(
+        timeout=15.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        http2=True,
+    )
+    get_geocoder().set_client(http_client)
+
     # Initialize browser pool
     try:
         _browser_manager = await BrowserManager.get_instance()
@@ -87,6 +99,12 @@ async def lifespan(app: FastAPI):
         await _browser_manager.close()
         logger.info("Browser manager closed")
 
+    # Close DOB scraper HTTP client
+    await get_dob_scraper().close()
+
+    # Close shared HTTP client
+    await http_client.aclose()
+
     # Close cache
     cache_service.close()
     logger.info("Cache service closed")
@@ -266,9 +284,17 @@ async def cache_stats():
 if __name__ == "__main__":
     import uvicorn
 
+    # Prefer uvloop (shipped with uvicorn[standard]) over the default asyncio loop
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     uvicorn.run(
         "main:app",
         host=_settings.host,
         port=_settings.port,
         reload=_settings.debug,
+        loop=loop,
     )
@@ -0,0 +1,48 @@
+"""Regression fixtures for the DOB BIS status page parser."""
+
+import asyncio
+import unittest
+
+from app.scrapers.dob_scraper import DOBScraper
+
+
+def parse(html_content: str):
+    return asyncio.run(DOBScraper()._extract_data_from_page(html_content))
+
+
+class ActiveOrderTextTests(unittest.TestCase):
+    def test_entity_encoded_stop_work_order_marked_active(self):
+        status = parse(
+            "<html><body><p>Stop&nbsp;Work&nbsp;Order issued - Active</p></body></html>"
+        )
+        self.assertTrue(status.stop_work_order)
+        self.assertFalse(status.vacate_order)
+
+    def test_vacate_and_active_in_separate_elements(self):
+        status = parse(
+            "<html><body><p>Vacate history</p><p>Active permits: 2</p></body></html>"
+        )
+        self.assertFalse(status.vacate_order)
+        self.assertFalse(status.stop_work_order)
+
+    def test_vacate_marked_active_within_one_cell(self):
+        status = parse("<table><tr><td>Vacate issued 01/02/2024 - ACTIVE</td></tr></table>")
+        self.assertTrue(status.vacate_order)
+
+
+class OrderCellTests(unittest.TestCase):
+    def test_order_phrase_cell(self):
+        status = parse("<TABLE><TR><TD>Full Vacate</TD></TR></TABLE>")
+        self.assertTrue(status.vacate_order)
+
+    def test_bare_label_cell_is_not_an_order(self):
+        status = parse("<table><tr><td>Vacate</td><td>No</td></tr></table>")
+        self.assertFalse(status.vacate_order)
+
+    def test_status_cell(self):
+        status = parse('<table><tr><td class="status">SWO</td></tr></table>')
+        self.assertTrue(status.stop_work_order)
+
+
+if __name__ == "__main__":
+    unittest.main()